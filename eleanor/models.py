@@ -1,7 +1,3 @@
-import math
-
-from astropy.io import fits as pyfits
-from lightkurve.utils import channel_to_module_output
 import numpy as np
 import tensorflow as tf
 
@@ -29,8 +25,35 @@ class Model:
         s1, s2 = self.shape
         self.y, self.x = np.mgrid[r:r+s1-1:1j*s1, c:c+s2-1:1j*s2]
 
+    def _quadratic(self, xo, yo, a, b, c):
+        """
+        Quadratic form a*dx**2 + 2*b*dx*dy + c*dy**2 shared by the models,
+        stacked along a leading axis with one grid per star. The numpy grids
+        are converted to the dtype of the centers, so the models run in the
+        precision of their inputs.
+        """
+        dx = self.x - tf.reshape(xo, (-1, 1, 1))
+        dy = self.y - tf.reshape(yo, (-1, 1, 1))
+        return dx * (a * dx + 2 * b * dy) + c * dy * dy
+
+    def _sum_stars(self, flux, psf):
+        """
+        Normalizes each star's PSF, scales it by its flux and sums the stars.
+        """
+        psf_sum = tf.reduce_sum(psf, axis=[1, 2], keepdims=True)
+        flux = tf.reshape(flux, (-1, 1, 1))
+        # Combine the per-star scalars first so only one grid-sized product is needed
+        return tf.reduce_sum(psf * (flux / psf_sum), axis=0)
+
 
 class Gaussian(Model):
+    # Shape parameters taken by evaluate, in order, as (name, initial value,
+    # fit bounds), and the fit bounds on the shift of the star positions
+    shape_params = [('a', 1., (0, np.infty)),
+                    ('b', 0., (-0.5, 0.5)),
+                    ('c', 1., (0, np.infty))]
+    shift_bounds = (-1.0, 1.0)
+
     def __call__(self, *params):
         return self.evaluate(*params)
 
@@ -40,8 +63,10 @@ class Gaussian(Model):
         Parameters
         ----------
         flux : tf.Variable
+            Flux of each star; either a scalar or one entry per star.
         xo, yo : tf.Variable, tf.Variable
-            Center coordiantes of the Gaussian.
+            Center coordiantes of the Gaussian, with the same length as `flux`.
+            All stars are evaluated together and summed into a single model.
         a, b, c : tf.Variable, tf.Variable
             Parameters that control the rotation angle
             and the stretch along the major axis of the Gaussian,
@@ -50,21 +75,25 @@ class Gaussian(Model):
         ----------
         https://en.wikipedia.org/wiki/Gaussian_function#Two-dimensional_Gaussian_function
         """
-        dx = self.x - xo
-        dy = self.y - yo
-        psf = tf.exp(-(a * dx ** 2 + 2 * b * dx * dy + c * dy ** 2))
-        psf_sum = tf.reduce_sum(psf)
-        return flux * psf / psf_sum
+        psf = tf.exp(-self._quadratic(xo, yo, a, b, c))
+        return self._sum_stars(flux, psf)
 
 
 class Moffat(Model):
+    shape_params = [('a', 1., (0, 3.0)),
+                    ('b', 0., (-0.5, 0.5)),
+                    ('c', 1., (0, 3.0)),
+                    ('beta', 1., (0, 10))]
+    shift_bounds = (-2.0, 2.0)
+
     def __call__(self, *params):
         return self.evaluate(*params)
 
     def evaluate(self, flux, xo, yo, a, b, c, beta):
-        dx = self.x - xo
-        dy = self.y - yo
-        psf = tf.divide(1., tf.pow(1. + a * dx ** 2 + 2 * b * dx * dy + c * dy ** 2, beta))
-        psf_sum = tf.reduce_sum(psf)
-        return flux * psf / psf_sum
+        psf = tf.pow(1. + self._quadratic(xo, yo, a, b, c), -beta)
+        return self._sum_stars(flux, psf)
+
 
+# Lookup of the PSF models available to TargetData.psf_lightcurve
+MODELS = {'gaussian': Gaussian,
+          'moffat': Moffat}
@@ -817,7 +817,8 @@ class TargetData(object):
         nstars: int, optional
             Number of stars to be modeled on the TPF.
         model: string, optional
-            PSF model to be applied. Presently must be `gaussian`, which models a single Gaussian.
+            PSF model to be applied. Must be `gaussian`, which models each star as a Gaussian,
+            or `moffat`, which models each star as a Moffat profile.
             Will be extended in the future once TESS PRF models are made publicly available.
         likelihood: string, optinal
             The data statistics given the parameters. Options are: 'gaussian' and 'poisson'.
@@ -843,21 +844,27 @@ class TargetData(object):
         """
 
         import tensorflow as tf
-        from .models import Gaussian, Moffat
+        from .models import MODELS
         from tqdm import tqdm
 
         tf.logging.set_verbosity(tf.logging.ERROR)
 
+        if model not in MODELS:
+            raise ValueError('This model is not incorporated yet!') # we probably want this to be a warning actually,
+                                                                    # and a gentle return
+
+        # Defaults are built directly in the float64 used by the fit, so the
+        # conversion below does not have to copy them a second time
         if data_arr is None:
-            data_arr = self.tpf + 0.0
+            data_arr = self.tpf.astype(np.float64)
             data_arr[np.isnan(data_arr)] = 0.0
         if err_arr is None:
             if err_method == True:
-                err_arr = (self.tpf_err + 0.0) ** 2
+                err_arr = np.square(self.tpf_err, dtype=np.float64)
             else:
                 err_arr = np.ones_like(data_arr)
         if bkg_arr is None:
-            bkg_arr = self.flux_bkg + 0.0
+            bkg_arr = self.flux_bkg.astype(np.float64)
 
         if yc is None:
             yc = 0.5 * np.ones(nstars) * np.shape(data_arr[0])[1]
@@ -881,77 +888,38 @@ class TargetData(object):
         if len(yc) != nstars:
             raise ValueError('yc must have length nstars')
 
+        # Match the float64 placeholders once here; otherwise every cadence is
+        # converted again on each loss evaluation made by the optimizer
+        data_arr = np.ascontiguousarray(data_arr, dtype=np.float64)
+        err_arr = np.ascontiguousarray(err_arr, dtype=np.float64)
+        bkg_arr = np.ascontiguousarray(bkg_arr, dtype=np.float64)
 
         flux = tf.Variable(np.ones(nstars)*np.max(data_arr[0]), dtype=tf.float64)
         bkg = tf.Variable(bkg_arr[0], dtype=tf.float64)
         xshift = tf.Variable(0.0, dtype=tf.float64)
         yshift = tf.Variable(0.0, dtype=tf.float64)
 
-        if (model == 'gaussian'):
-
-            gaussian = Gaussian(shape=data_arr.shape[1:], col_ref=0, row_ref=0)
+        psf_model = MODELS[model](shape=data_arr.shape[1:], col_ref=0, row_ref=0)
 
-            a = tf.Variable(initial_value=1., dtype=tf.float64)
-            b = tf.Variable(initial_value=0., dtype=tf.float64)
-            c = tf.Variable(initial_value=1., dtype=tf.float64)
-
-
-            if nstars == 1:
-                mean = gaussian(flux, xc[0]+xshift, yc[0]+yshift, a, b, c)
-            else:
-                mean = [gaussian(flux[j], xc[j]+xshift, yc[j]+yshift, a, b, c) for j in range(nstars)]
-                mean = np.sum(mean, axis=0)
+        # The model describes its own shape parameters and bounds, so nothing
+        # below depends on which model was chosen
+        shape_vars = [tf.Variable(initial_value=init, dtype=tf.float64)
+                      for name, init, bounds in psf_model.shape_params]
 
-            var_list = [flux, xshift, yshift, a, b, c, bkg]
+        mean = psf_model(flux, xshift + np.asarray(xc, dtype=float), yshift + np.asarray(yc, dtype=float), *shape_vars)
 
-            var_to_bounds = {flux: (0, np.infty),
-                             xshift: (-1.0, 1.0),
-                             yshift: (-1.0, 1.0),
-                             a: (0, np.infty),
-                             b: (-0.5, 0.5),
-                             c: (0, np.infty)
-                            }
-
-        elif model == 'moffat':
-
-            moffat = Moffat(shape=data_arr.shape[1:], col_ref=0, row_ref=0)
-
-            a = tf.Variable(initial_value=1., dtype=tf.float64)
-            b = tf.Variable(initial_value=0., dtype=tf.float64)
-            c = tf.Variable(initial_value=1., dtype=tf.float64)
-            beta = tf.Variable(initial_value=1, dtype=tf.float64)
-
-
-            if nstars == 1:
-                mean = moffat(flux, xc[0]+xshift, yc[0]+yshift, a, b, c, beta)
-            else:
-                mean = [moffat(flux[j], xc[j]+xshift, yc[j]+yshift, a, b, c, beta) for j in range(nstars)]
-                mean = np.sum(mean, axis=0)
+        var_list = [flux, xshift, yshift] + shape_vars + [bkg]
 
-            var_list = [flux, xshift, yshift, a, b, c, beta, bkg]
+        var_to_bounds = {flux: (0, np.infty),
+                         xshift: psf_model.shift_bounds,
+                         yshift: psf_model.shift_bounds
+                        }
+        for var, (name, init, bounds) in zip(shape_vars, psf_model.shape_params):
+            var_to_bounds[var] = bounds
 
-            var_to_bounds = {flux: (0, np.infty),
-                             xshift: (-2.0, 2.0),
-                             yshift: (-2.0, 2.0),
-                             a: (0, 3.0),
-                             b: (-0.5, 0.5),
-                             c: (0, 3.0),
-                             beta: (0, 10)
-                            }
-
-
-            betaout = np.zeros(len(data_arr))
-
-
-        else:
-            raise ValueError('This model is not incorporated yet!') # we probably want this to be a warning actually,
-                                                                    # and a gentle return
-
-        aout = np.zeros(len(data_arr))
-        bout = np.zeros(len(data_arr))
-        cout = np.zeros(len(data_arr))
         xout = np.zeros(len(data_arr))
         yout = np.zeros(len(data_arr))
+        shape_out = np.zeros((len(shape_vars), len(data_arr)))
 
         mean += bkg
 
@@ -966,8 +934,6 @@ class TargetData(object):
         else:
             raise ValueError("likelihood argument {0} not supported".format(likelihood))
 
-        grad = tf.gradients(nll, var_list)
-
         sess = tf.Session(config=tf.ConfigProto(device_count={'GPU': 0}))
         sess.run(tf.global_variables_initializer())
 
@@ -978,29 +944,18 @@ class TargetData(object):
 
         llout = np.zeros(len(data_arr))
 
+        # Pair each fitted quantity with its output array once, outside the loop
+        fetches = [flux, bkg, xshift, yshift, nll] + shape_vars
+        outputs = [fout, bkgout, xout, yout, llout] + list(shape_out)
+
         for i in tqdm(range(len(data_arr))):
-            optim = optimizer.minimize(session=sess, feed_dict={data:data_arr[i], derr:err_arr[i], bkgval:bkg_arr[i]}) # we could also pass a pointing model here
+            feed_dict = {data:data_arr[i], derr:err_arr[i], bkgval:bkg_arr[i]}
+            optim = optimizer.minimize(session=sess, feed_dict=feed_dict) # we could also pass a pointing model here
                                                                            # and just fit a single offset in all frames
 
-            fout[i] = sess.run(flux)
-            bkgout[i] = sess.run(bkg)
-
-            if model == 'gaussian':
-                aout[i] = sess.run(a)
-                bout[i] = sess.run(b)
-                cout[i] = sess.run(c)
-                xout[i] = sess.run(xshift)
-                yout[i] = sess.run(yshift)
-                llout[i] = sess.run(nll, feed_dict={data:data_arr[i], derr:err_arr[i], bkgval:bkg_arr[i]})
-
-            if model == 'moffat':
-                aout[i] = sess.run(a)
-                bout[i] = sess.run(b)
-                cout[i] = sess.run(c)
-                xout[i] = sess.run(xshift)
-                yout[i] = sess.run(yshift)
-                llout[i] = sess.run(nll, feed_dict={data:data_arr[i], derr:err_arr[i], bkgval:bkg_arr[i]})
-                betaout[i] = sess.run(beta)
+            # Fetch all fitted values in one pass through the graph
+            for out, value in zip(outputs, sess.run(fetches, feed_dict=feed_dict)):
+                out[i] = value
 
 
         sess.close()
@@ -1013,21 +968,12 @@ class TargetData(object):
         self.psf_bkg = bkgout
 
         if verbose:
-            if model == 'gaussian':
-                self.psf_a = aout
-                self.psf_b = bout
-                self.psf_c = cout
-                self.psf_x = xout
-                self.psf_y = yout
-                self.psf_ll = llout
-            if model == 'moffat':
-                self.psf_a = aout
-                self.psf_b = bout
-                self.psf_c = cout
-                self.psf_x = xout
-                self.psf_y = yout
-                self.psf_ll = llout
-                self.psf_beta = betaout
+            self.psf_x = xout
+            self.psf_y = yout
+            self.psf_ll = llout
+            # e.g. psf_a, psf_b, psf_c, and psf_beta for the Moffat model
+            for (name, init, bounds), out in zip(psf_model.shape_params, shape_out):
+                setattr(self, 'psf_' + name, out)
             if nstars > 1:
                 self.all_psf = fout
         return
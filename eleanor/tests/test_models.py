@@ -0,0 +1,54 @@
+import numpy as np
+import tensorflow as tf
+
+from ..models import Gaussian, Moffat
+
+def test_multiple_stars():
+    '''Does evaluating several stars at once give the same model as
+    evaluating each star on its own and adding them up?
+    '''
+    flux = np.array([100.0, 40.0])
+    xc = np.array([6.2, 3.5])
+    yc = np.array([5.8, 9.1])
+
+    gaussian = Gaussian(shape=(13, 13), col_ref=0, row_ref=0)
+    moffat = Moffat(shape=(13, 13), col_ref=0, row_ref=0)
+
+    stacked = [gaussian(flux, xc, yc, 1.0, 0.1, 0.8),
+               moffat(flux, xc, yc, 1.0, 0.1, 0.8, 2.0)]
+    single = [[gaussian(flux[j], xc[j], yc[j], 1.0, 0.1, 0.8) for j in range(2)],
+              [moffat(flux[j], xc[j], yc[j], 1.0, 0.1, 0.8, 2.0) for j in range(2)]]
+
+    with tf.Session() as sess:
+        stacked, single = sess.run([stacked, single])
+
+    for i in range(2):
+        assert(np.shape(stacked[i]) == (13, 13))
+        assert(np.allclose(stacked[i], np.sum(single[i], axis=0)))
+        assert(np.isclose(np.sum(stacked[i]), np.sum(flux))) # each star is normalized over the TPF
+
+def test_precision():
+    '''Do the models evaluate in the precision of the variables driving them?'''
+    for dtype in [tf.float32, tf.float64]:
+        gaussian = Gaussian(shape=(13, 13), col_ref=0, row_ref=0)
+        moffat = Moffat(shape=(13, 13), col_ref=0, row_ref=0)
+
+        flux = tf.Variable(100.0, dtype=dtype)
+        xo = tf.Variable(6.2, dtype=dtype)
+        yo = tf.Variable(5.8, dtype=dtype)
+        a = tf.Variable(1.0, dtype=dtype)
+        b = tf.Variable(0.1, dtype=dtype)
+        c = tf.Variable(0.8, dtype=dtype)
+        beta = tf.Variable(2.0, dtype=dtype)
+
+        models = [gaussian(flux, xo, yo, a, b, c),
+                  moffat(flux, xo, yo, a, b, c, beta)]
+        for m in models:
+            assert(m.dtype == dtype)
+
+        with tf.Session() as sess:
+            sess.run(tf.variables_initializer([flux, xo, yo, a, b, c, beta]))
+            models = sess.run(models)
+
+        for m in models:
+            assert(np.isclose(np.sum(m), 100.0))
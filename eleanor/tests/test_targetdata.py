@@ -30,4 +30,42 @@ def test_arb_size_tpfs():
     data = TargetData(star, height=15, width=13)
     assert(np.shape(data.raw_flux[0] == (15,13))) # eleanor enforces oddness
 
+def test_psf_lightcurve_synthetic():
+    '''Does the PSF fit recover a synthetic Gaussian star, matching the
+    float64 model and likelihood it was generated from, without needing MAST?
+    '''
+    import tensorflow as tf
+
+    shape = (13, 13)
+    fluxes = np.array([5.0e4, 5.1e4])
+    xo, yo = 6.3, 6.7 # fit starts from the TPF center, 6.5
+    a, b, c = 0.8, 0.05, 0.9
+    bkg = 100.0
+
+    y, x = np.mgrid[0:shape[0], 0:shape[1]].astype(np.float64)
+    dx, dy = x - xo, y - yo
+    psf = np.exp(-(a * dx ** 2 + 2 * b * dx * dy + c * dy ** 2))
+    psf /= np.sum(psf)
+    data_arr = fluxes[:, None, None] * psf[None] + bkg
+    err_arr = data_arr + 0.0 # Poisson variance
+    bkg_arr = np.full(len(fluxes), bkg)
+
+    for likelihood in ['gaussian', 'poisson']:
+        tf.reset_default_graph()
+
+        data = TargetData.__new__(TargetData) # skip the MAST download in __init__
+        data.language = 'English'
+        data.psf_lightcurve(data_arr=data_arr + 0.0, err_arr=err_arr + 0.0, bkg_arr=bkg_arr + 0.0,
+                            likelihood=likelihood)
+
+        if likelihood == 'gaussian':
+            ll = np.zeros(len(fluxes))
+        else:
+            ll = np.sum(data_arr + bkg - (data_arr + bkg) * np.log(data_arr + bkg), axis=(1,2))
 
+        assert(np.allclose(data.psf_flux, fluxes, rtol=5e-3))
+        assert(np.allclose(data.psf_x, xo - 6.5, atol=1e-2))
+        assert(np.allclose(data.psf_y, yo - 6.5, atol=1e-2))
+        assert(np.allclose(data.psf_ll, ll, rtol=1e-4, atol=1.0))
+        for name, value in zip(['a', 'b', 'c'], [a, b, c]):
+            assert(np.allclose(getattr(data, 'psf_' + name), value, atol=1e-2))
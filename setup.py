@@ -85,7 +85,7 @@ setup(
     install_requires=[
         'photutils>=0.7', 'tqdm', 'lightkurve>=1.9.0', 'astropy>=3.2.3',
         'astroquery', 'pandas',
-        'setuptools>=41.0.0', 'torch', 'tensorflow<2.0.0',
+        'setuptools>=41.0.0', 'tensorflow<2.0.0',
         'beautifulsoup4>=4.6.0', 'tess-point>=0.3.6'],
     classifiers=[
         'Development Status :: 5 - Production/Stable',